@@ -1,10 +1,23 @@
 import json
-from typing import Annotated
+from typing import Annotated, Any
 
 from arcade.sdk import tool
 
 from arcade_jira.tools.constants import JiraConfig
-from arcade_jira.tools.utils import _handle_jira_api_error, _send_jira_request
+from arcade_jira.tools.utils import (
+    ChangePosition,
+    _decode_change_cursor,
+    _encode_change_cursor,
+    _filter_new_changes,
+    _find_anchor_index,
+    _get_user_time_zone,
+    _handle_jira_api_error,
+    _merge_new_changes,
+    _next_page_anchor,
+    _search_issues_updated_since,
+    _send_jira_request,
+    _step_back_to_anchor,
+)
 
 
 @tool()
@@ -94,6 +107,88 @@ async def list_project_issues(
     return []
 
 
+@tool()
+async def list_issue_changes(
+    project_key: Annotated[str, "The project key to watch for issue changes"],
+    cursor: Annotated[
+        str | None,
+        "The cursor returned by a previous call. Omit it to start from the oldest issue",
+    ] = None,
+    max_results: Annotated[int, "Maximum number of changed issues to return"] = 50,
+) -> Annotated[
+    dict[str, Any],
+    "A dictionary with 'issues' (JSON strings representing the changed issues, oldest first, "
+    "each containing id, key and fields with summary, status, and updated), 'next_cursor' "
+    "(pass it to the next call) and 'has_more' (True if more changes are already available)",
+]:
+    """
+    List issues in a Jira project that changed since a cursor from a previous call.
+
+    Deleted issues never appear in this feed.
+    """
+    jira_config = JiraConfig.from_env()
+
+    position = _decode_change_cursor(cursor) if cursor else None
+    time_zone = await _get_user_time_zone(jira_config)
+
+    changes: dict[str, dict[str, Any]] = {}
+    has_more = False
+    query_since = position
+    start_at = 0
+    anchor = None
+    while True:
+        response = await _search_issues_updated_since(
+            project_key,
+            query_since.raw_updated if query_since else None,
+            time_zone,
+            jira_config,
+            start_at=start_at,
+        )
+
+        if response.status_code != 200:
+            _handle_jira_api_error(response)
+            return {"issues": [], "next_cursor": cursor or "", "has_more": False}
+
+        data = response.json()
+        page = data["issues"]
+        if anchor is not None:
+            anchor_index = _find_anchor_index(page, anchor)
+            if anchor_index is None:
+                # The offsets shifted, so paging on would skip issues. Step back to the
+                # anchor, or run a new query from the last kept issue if the anchor moved.
+                next_start = await _step_back_to_anchor(anchor, start_at, len(page), jira_config)
+                if next_start is None:
+                    query_since, next_start, anchor = position, 0, None
+                start_at = next_start
+                continue
+            start_at += anchor_index
+            page = page[anchor_index:]
+
+        has_more = _merge_new_changes(changes, _filter_new_changes(page, position), max_results)
+        if changes:
+            position = ChangePosition.from_issue(next(reversed(changes.values())))
+
+        exhausted = not page or start_at + len(page) >= data["total"]
+        if has_more or exhausted:
+            break
+        if len(changes) >= max_results:
+            # Everything past this page is newer than the last kept issue
+            has_more = True
+            break
+
+        start_at, anchor = _next_page_anchor(page, start_at)
+
+    next_cursor = ""
+    if position is not None:
+        next_cursor = _encode_change_cursor(position.raw_updated, position.issue_id)
+
+    return {
+        "issues": [json.dumps(issue) for issue in changes.values()],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+
+
 @tool()
 async def delete_issue(
     issue_key: Annotated[str, "The issue key to delete"],
@@ -1,10 +1,19 @@
 import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import httpx
 from arcade.sdk.errors import ToolExecutionError
 
 from arcade_jira.tools.constants import JiraConfig
 
+# The largest page the /search endpoint returns
+SEARCH_PAGE_SIZE = 100
+
 
 async def _send_jira_request(
     method: str,
@@ -120,3 +129,289 @@ def _send_jira_request_sync(
             raise ToolExecutionError(str(e)) from e
 
     return response
+
+
+@dataclass(frozen=True)
+class ChangePosition:
+    """The position of an issue change in the changes feed, ordered by (updated, issue_id)."""
+
+    updated: datetime
+    issue_id: int
+    raw_updated: str
+
+    @classmethod
+    def from_issue(cls, issue: dict[str, Any]) -> "ChangePosition":
+        raw_updated = issue["fields"]["updated"]
+        return cls(_parse_jira_datetime(raw_updated), int(issue["id"]), raw_updated)
+
+    def is_before(self, other: "ChangePosition") -> bool:
+        return (self.updated, self.issue_id) < (other.updated, other.issue_id)
+
+
+def _parse_jira_datetime(value: str) -> datetime:
+    """
+    Parse a Jira timestamp such as "2024-01-15T10:30:45.123+0100".
+
+    Args:
+        value: The timestamp string returned by the Jira API.
+
+    Returns:
+        A timezone-aware datetime.
+    """
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def _format_jql_datetime(value: str, time_zone: tzinfo) -> str:
+    """
+    Format a Jira timestamp as a minute-precision JQL lower bound.
+
+    JQL interprets dates in the searching user's profile timezone, which need not match the
+    offset of the timestamps Jira returns, so the timestamp is converted to it first.
+
+    Args:
+        value: The timestamp string returned by the Jira API.
+        time_zone: The searching user's timezone.
+
+    Returns:
+        The timestamp in the given timezone, formatted as "yyyy/MM/dd HH:mm".
+    """
+    return _parse_jira_datetime(value).astimezone(time_zone).strftime("%Y/%m/%d %H:%M")
+
+
+async def _get_user_time_zone(jira_config: JiraConfig) -> tzinfo:
+    """
+    Get the profile timezone of the user the Jira configuration authenticates as.
+
+    Args:
+        jira_config: The Jira configuration object.
+
+    Returns:
+        The user's timezone, which JQL uses to interpret date literals.
+
+    Raises:
+        ToolExecutionError: If the request fails or the timezone is unknown.
+    """
+    response = await _send_jira_request("GET", "/myself", jira_config)
+    _handle_jira_api_error(response)
+
+    time_zone = response.json().get("timeZone", "UTC")
+    try:
+        return ZoneInfo(time_zone)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        error_msg = f"Unknown Jira user timezone: {time_zone}"
+        raise ToolExecutionError(error_msg) from e
+
+
+def _encode_change_cursor(updated: str, issue_id: int) -> str:
+    """
+    Encode the position of the last seen issue change as an opaque cursor.
+
+    Args:
+        updated: The "updated" timestamp of the last seen issue.
+        issue_id: The numeric id of the last seen issue, used to break ties between issues
+            updated at the same time.
+
+    Returns:
+        A URL-safe cursor string.
+    """
+    payload = json.dumps({"updated": updated, "id": issue_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_change_cursor(cursor: str) -> ChangePosition:
+    """
+    Decode a cursor produced by _encode_change_cursor.
+
+    Args:
+        cursor: The opaque cursor string.
+
+    Returns:
+        The position of the last seen issue change.
+
+    Raises:
+        ToolExecutionError: If the cursor is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        updated = payload["updated"]
+        return ChangePosition(_parse_jira_datetime(updated), int(payload["id"]), updated)
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        error_msg = f"Invalid cursor: {cursor}"
+        raise ToolExecutionError(error_msg) from e
+
+
+def _filter_new_changes(
+    issues: list[dict[str, Any]], since: ChangePosition | None
+) -> list[dict[str, Any]]:
+    """
+    Keep only the issues that come after a position in the changes feed.
+
+    Args:
+        issues: A page of issues from the search endpoint, ordered by updated and id.
+        since: The position of the last issue change already returned, if any.
+
+    Returns:
+        The new issues, in their original order.
+    """
+    if since is None:
+        return list(issues)
+    return [issue for issue in issues if since.is_before(ChangePosition.from_issue(issue))]
+
+
+def _merge_new_changes(
+    changes: dict[str, dict[str, Any]], new_issues: list[dict[str, Any]], max_results: int
+) -> bool:
+    """
+    Add new issue changes to the changes collected so far, in feed order.
+
+    An issue edited while the feed is being read shows up again further on. Only its latest
+    state is kept, moved to its latest position.
+
+    Args:
+        changes: The changes collected so far, keyed by issue id. Updated in place.
+        new_issues: New issue changes, ordered by updated and id.
+        max_results: The maximum number of distinct issues to collect.
+
+    Returns:
+        True if some of the new changes did not fit.
+    """
+    for issue in new_issues:
+        if len(changes) >= max_results and issue["id"] not in changes:
+            return True
+        changes.pop(issue["id"], None)
+        changes[issue["id"]] = issue
+    return False
+
+
+def _find_anchor_index(issues: list[dict[str, Any]], anchor: dict[str, Any]) -> int | None:
+    """
+    Return the index of the anchor in a page of search results, or None if it is absent.
+
+    The anchor only matches if it was not updated since it was read, as an edited anchor
+    has moved to the end of the results.
+    """
+    return next(
+        (
+            i
+            for i, issue in enumerate(issues)
+            if issue["id"] == anchor["id"]
+            and issue["fields"]["updated"] == anchor["fields"]["updated"]
+        ),
+        None,
+    )
+
+
+def _next_page_anchor(
+    issues: list[dict[str, Any]], start_at: int
+) -> tuple[int, dict[str, Any] | None]:
+    """
+    Work out where the next page of search results starts.
+
+    Each page overlaps the previous one by an issue (the anchor), so a shift in the result
+    set between requests can be detected and no issue is skipped.
+
+    Args:
+        issues: The current page of search results.
+        start_at: The offset of the current page.
+
+    Returns:
+        The offset of the next page and the issue expected first on it, if any.
+    """
+    if len(issues) > 1:
+        return start_at + len(issues) - 1, issues[-1]
+    return start_at + len(issues), None
+
+
+async def _get_issue_updated(issue_id: str, jira_config: JiraConfig) -> str | None:
+    """
+    Get the current "updated" timestamp of an issue.
+
+    Args:
+        issue_id: The issue id.
+        jira_config: The Jira configuration object.
+
+    Returns:
+        The timestamp, or None if the issue no longer exists.
+
+    Raises:
+        ToolExecutionError: If the request fails for any other reason.
+    """
+    try:
+        response = await _send_jira_request(
+            "GET", f"/issue/{issue_id}", jira_config, params={"fields": "updated"}
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None
+        _handle_jira_api_error(e.response)
+        raise
+
+    updated: str = response.json()["fields"]["updated"]
+    return updated
+
+
+async def _step_back_to_anchor(
+    anchor: dict[str, Any], start_at: int, page_size: int, jira_config: JiraConfig
+) -> int | None:
+    """
+    Work out where to look for an anchor issue that is no longer at its expected offset.
+
+    If the anchor is unchanged, an issue before it was edited or deleted and the anchor
+    moved towards the start of the results, so the search steps back a page. If the anchor
+    itself was edited or deleted, it moved to the end of the results or left them, and
+    stepping back would only rescan the whole result set.
+
+    Args:
+        anchor: The issue expected first on the page.
+        start_at: The offset where the anchor was expected.
+        page_size: The size of the page that did not contain the anchor.
+        jira_config: The Jira configuration object.
+
+    Returns:
+        The offset to search from next, or None if the search must be run again.
+    """
+    if start_at == 0:
+        return None
+    if await _get_issue_updated(anchor["id"], jira_config) != anchor["fields"]["updated"]:
+        return None
+    return max(0, start_at - max(page_size - 1, 1))
+
+
+async def _search_issues_updated_since(
+    project_key: str,
+    updated_since: str | None,
+    time_zone: tzinfo,
+    jira_config: JiraConfig,
+    start_at: int = 0,
+    max_results: int = SEARCH_PAGE_SIZE,
+) -> httpx.Response:
+    """
+    Search a project's issues updated at or after a timestamp, oldest change first.
+
+    Args:
+        project_key: The project key to search.
+        updated_since: A Jira timestamp to use as lower bound, or None for all issues.
+        time_zone: The searching user's timezone, from _get_user_time_zone.
+        jira_config: The Jira configuration object.
+        start_at: The index of the first result to return.
+        max_results: The maximum number of results to return.
+
+    Returns:
+        The response object from the search request.
+    """
+    # JQL only has minute precision, so the results can include issues the caller has
+    # already seen; _filter_new_changes drops them using the exact timestamp and issue id
+    jql = f'project = "{project_key}"'
+    if updated_since is not None:
+        jql += f' AND updated >= "{_format_jql_datetime(updated_since, time_zone)}"'
+    jql += " ORDER BY updated ASC, id ASC"
+
+    params = {
+        "jql": jql,
+        "startAt": start_at,
+        "maxResults": max_results,
+        "fields": "summary,status,updated",
+        "validateQuery": "strict",
+    }
+
+    return await _send_jira_request("GET", "/search", jira_config, params=params)
@@ -5,6 +5,7 @@ from arcade_jira.tools.issues import (
     create_issue,
     delete_issue,
     get_issue_transitions,
+    list_issue_changes,
     list_project_issues,
     transition_issue,
 )
@@ -19,6 +20,7 @@ catalog = ToolCatalog()
 catalog.add_tool(create_issue, "Jira")
 catalog.add_tool(transition_issue, "Jira")
 catalog.add_tool(list_project_issues, "Jira")
+catalog.add_tool(list_issue_changes, "Jira")
 catalog.add_tool(delete_issue, "Jira")
 catalog.add_tool(get_issue_transitions, "Jira")
 
@@ -120,6 +122,31 @@ def jira_issues_eval_suite() -> EvalSuite:
         ],
     )
 
+    # List Issue Changes Cases
+    changes_cursor = "eyJ1cGRhdGVkIjoiMjAyNC0wMS0xNVQxMDozMDo0NS4xMjMrMDAwMCIsImlkIjoxMDAwMX0="
+    suite.add_case(
+        name="List issue changes since cursor",
+        user_message=(
+            "what changed in the ARCADE project since my last check? "
+            f"the cursor from last time was {changes_cursor}"
+        ),
+        expected_tool_calls=[
+            (
+                list_issue_changes,
+                {
+                    "project_key": "ARCADE",
+                    "cursor": changes_cursor,
+                    "max_results": 50,
+                },
+            )
+        ],
+        critics=[
+            BinaryCritic(critic_field="project_key", weight=0.4),
+            BinaryCritic(critic_field="cursor", weight=0.4),
+            BinaryCritic(critic_field="max_results", weight=0.2),
+        ],
+    )
+
     # Transition Issue Cases
     history_with_transitions = [
         {"role": "user", "content": "what are the possible transitions for ARCADE-123?"},
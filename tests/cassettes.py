@@ -0,0 +1,281 @@
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Supported record modes, named after their vcrpy counterparts:
+#   "once" - replay from the cassette if it exists, otherwise record a new one
+#   "none" - replay only; any request missing from the cassette is an error
+#   "all"  - always hit the live API and overwrite the cassette
+#   "off"  - bypass cassettes entirely and talk to the live API
+RECORD_MODES = ("once", "none", "all", "off")
+
+CASSETTE_FORMAT_VERSION = 1
+
+# Personal data masked in recorded response bodies, by JSON key
+MASKED_FIELDS = {
+    "accountId": "000000:00000000-0000-0000-0000-000000000000",
+    "emailAddress": "user@example.com",
+}
+
+
+class CassetteMissError(LookupError):
+    """Raised when a request cannot be replayed from the active cassette."""
+
+
+def _request_fingerprint(request: httpx.Request) -> str:
+    """
+    Build a stable lookup key for a request.
+
+    The host and headers are left out so that cassettes recorded against one Jira site
+    (and one set of credentials) can be replayed with any configuration.
+
+    Args:
+        request: The outgoing request.
+
+    Returns:
+        A hex digest identifying the method, path, query parameters, and JSON body.
+    """
+    query = sorted(request.url.params.multi_items())
+    body = request.content
+    if body:
+        with contextlib.suppress(ValueError):
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode()
+
+    digest = hashlib.sha256()
+    digest.update(request.method.upper().encode())
+    digest.update(b"\0")
+    digest.update(request.url.path.encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(query, separators=(",", ":")).encode())
+    digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()[:32]
+
+
+def _mask_fields(value: Any, masked: dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if key in MASKED_FIELDS and isinstance(item, str):
+                masked[item] = MASKED_FIELDS[key]
+                item = MASKED_FIELDS[key]
+            result[key] = _mask_fields(item, masked)
+        return result
+    if isinstance(value, list):
+        return [_mask_fields(item, masked) for item in value]
+    return value
+
+
+def _scrub_text(text: str, replacements: dict[str, str]) -> str:
+    """
+    Remove tenant data from a response body before it is written to a cassette.
+
+    Args:
+        text: The response body.
+        replacements: Strings to replace (e.g. the real site host) and their placeholders.
+
+    Returns:
+        The body with MASKED_FIELDS masked (if it is JSON), wherever their values appear
+        (e.g. also inside URLs), and with the replacements applied.
+    """
+    masked: dict[str, str] = {}
+    with contextlib.suppress(ValueError):
+        text = json.dumps(_mask_fields(json.loads(text), masked), ensure_ascii=False)
+    for old, new in {**masked, **replacements}.items():
+        if old:
+            text = text.replace(old, new)
+    return text
+
+
+def _encode_response(
+    response: httpx.Response, replacements: dict[str, str] | None = None
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {"status": response.status_code}
+    content_type = response.headers.get("content-type")
+    if content_type:
+        entry["type"] = content_type
+    if response.content:
+        try:
+            entry["text"] = _scrub_text(response.content.decode("utf-8"), replacements or {})
+        except UnicodeDecodeError:
+            entry["b64"] = base64.b64encode(response.content).decode("ascii")
+    return entry
+
+
+def _decode_response(entry: dict[str, Any], request: httpx.Request) -> httpx.Response:
+    if "b64" in entry:
+        content = base64.b64decode(entry["b64"])
+    else:
+        content = entry.get("text", "").encode("utf-8")
+
+    headers = {"content-type": entry["type"]} if "type" in entry else {}
+    return httpx.Response(entry["status"], headers=headers, content=content, request=request)
+
+
+class Cassette:
+    """
+    A recorded set of Jira API interactions stored as a single compact JSON file.
+
+    Interactions are indexed by request fingerprint, so replay is a dictionary lookup.
+    Identical requests made several times in a test (e.g. listing the same project twice)
+    are replayed in the order they were recorded. Recorded bodies are scrubbed of personal
+    data and of the given replacements (such as the real site host) before they are stored.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        record_mode: str = "once",
+        replacements: dict[str, str] | None = None,
+    ) -> None:
+        if record_mode not in RECORD_MODES:
+            error_msg = (
+                f"Invalid record mode '{record_mode}'. Expected one of: {', '.join(RECORD_MODES)}"
+            )
+            raise ValueError(error_msg)
+
+        self.path = Path(path)
+        self.record_mode = record_mode
+        self.replacements = {old: new for old, new in (replacements or {}).items() if old}
+        self.interactions: dict[str, list[dict[str, Any]]] = {}
+        self._play_counts: dict[str, int] = {}
+        self._dirty = False
+
+        if record_mode == "all" or not self.path.exists():
+            self.recording = record_mode in ("once", "all")
+        else:
+            self.recording = False
+            self._load()
+
+    def _load(self) -> None:
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("version") != CASSETTE_FORMAT_VERSION:
+            error_msg = f"Unsupported cassette format version in {self.path}: {data.get('version')}"
+            raise ValueError(error_msg)
+        self.interactions = data["interactions"]
+
+    def play(self, request: httpx.Request) -> httpx.Response:
+        """
+        Replay the next recorded response for a request.
+
+        Raises:
+            CassetteMissError: If the request (or another repetition of it) was not recorded.
+        """
+        key = _request_fingerprint(request)
+        entries = self.interactions.get(key, [])
+        index = self._play_counts.get(key, 0)
+        if index >= len(entries):
+            error_msg = (
+                f"No recorded response for {request.method} {request.url.path} "
+                f"(play #{index + 1}) in cassette {self.path}. "
+                "Re-record it with --record-mode=all."
+            )
+            raise CassetteMissError(error_msg)
+
+        self._play_counts[key] = index + 1
+        return _decode_response(entries[index], request)
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Append a response (whose body has already been read) to the cassette."""
+        key = _request_fingerprint(request)
+        self.interactions.setdefault(key, []).append(_encode_response(response, self.replacements))
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the cassette to disk if anything was recorded.
+
+        The file is written to a temporary sibling and atomically renamed into place, so
+        concurrent test workers never observe a partially written cassette.
+        """
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": CASSETTE_FORMAT_VERSION, "interactions": self.interactions}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, sort_keys=True, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """Synchronous httpx transport that records to or replays from a cassette."""
+
+    def __init__(self, cassette: Cassette, wrapped: httpx.BaseTransport | None = None) -> None:
+        self.cassette = cassette
+        # Only open a real connection pool when we actually need to talk to Jira
+        if wrapped is None and cassette.recording:
+            wrapped = httpx.HTTPTransport()
+        self.wrapped = wrapped
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.wrapped is None or not self.cassette.recording:
+            return self.cassette.play(request)
+
+        response = self.wrapped.handle_request(request)
+        response.read()
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        if self.wrapped is not None:
+            self.wrapped.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Asynchronous httpx transport that records to or replays from a cassette."""
+
+    def __init__(self, cassette: Cassette, wrapped: httpx.AsyncBaseTransport | None = None) -> None:
+        self.cassette = cassette
+        if wrapped is None and cassette.recording:
+            wrapped = httpx.AsyncHTTPTransport()
+        self.wrapped = wrapped
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.wrapped is None or not self.cassette.recording:
+            return self.cassette.play(request)
+
+        response = await self.wrapped.handle_async_request(request)
+        await response.aread()
+        self.cassette.record(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        if self.wrapped is not None:
+            await self.wrapped.aclose()
+
+
+class CassetteHttpx:
+    """
+    Stand-in for the httpx module whose clients route every request through a cassette.
+
+    Patched over the httpx reference in arcade_jira.tools.utils for the duration of a test,
+    so the toolkit itself never knows about cassettes.
+    """
+
+    def __init__(self, cassette: Cassette) -> None:
+        self.cassette = cassette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(httpx, name)
+
+    def Client(self, **kwargs: Any) -> httpx.Client:
+        return httpx.Client(transport=CassetteTransport(self.cassette), **kwargs)
+
+    def AsyncClient(self, **kwargs: Any) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=AsyncCassetteTransport(self.cassette), **kwargs)
@@ -0,0 +1,86 @@
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+
+from tests.cassettes import RECORD_MODES, Cassette, CassetteHttpx
+
+CASSETTE_DIR = Path(__file__).parent / "fixtures" / "cassettes"
+
+# Placeholder configuration used when replaying, so no real Jira credentials are needed.
+REPLAY_ENV = {
+    "JIRA_BASE_URL": "https://example.atlassian.net",
+    "JIRA_EMAIL": "replay@example.com",
+    "JIRA_API_TOKEN": "replay-token",
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--record-mode",
+        action="store",
+        default=os.getenv("JIRA_RECORD_MODE", "once"),
+        choices=RECORD_MODES,
+        help=(
+            "How Jira API cassettes are used: 'once' replays existing cassettes and records "
+            "missing ones, 'none' only replays, 'all' re-records everything, 'off' disables "
+            "cassettes. Defaults to $JIRA_RECORD_MODE or 'once'."
+        ),
+    )
+
+
+def _recording_replacements() -> dict[str, str]:
+    """Map the real site host and account email to their placeholders in REPLAY_ENV."""
+    replacements = {}
+    base_url = os.getenv("JIRA_BASE_URL")
+    if base_url:
+        host = urlsplit(base_url).netloc
+        replacements[host] = urlsplit(REPLAY_ENV["JIRA_BASE_URL"]).netloc
+    email = os.getenv("JIRA_EMAIL")
+    if email:
+        replacements[email] = REPLAY_ENV["JIRA_EMAIL"]
+    return replacements
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> Iterator[None]:
+    """Expose each phase's report on the test item (e.g. item.rep_call) for fixtures."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture
+def jira_cassette(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Cassette | None]:
+    """Record or replay the Jira API traffic of a test from its own cassette file."""
+    record_mode = request.config.getoption("--record-mode")
+    if record_mode == "off":
+        yield None
+        return
+
+    module_name = request.node.module.__name__.rsplit(".", 1)[-1]
+    # Parametrized test ids may contain characters that are not valid in file names
+    file_name = re.sub(r"[^\w.-]", "_", request.node.name)
+    cassette = Cassette(
+        CASSETTE_DIR / module_name / f"{file_name}.json",
+        record_mode,
+        replacements=_recording_replacements(),
+    )
+    monkeypatch.setattr("arcade_jira.tools.utils.httpx", CassetteHttpx(cassette))
+    if not cassette.recording:
+        for name, value in REPLAY_ENV.items():
+            if os.getenv(name) is None:
+                monkeypatch.setenv(name, value)
+
+    yield cassette
+
+    # A failed test may have stopped halfway, so its recording is discarded rather than
+    # saved and replayed on every later run
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        cassette.save()
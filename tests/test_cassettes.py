@@ -0,0 +1,186 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tests.cassettes import (
+    AsyncCassetteTransport,
+    Cassette,
+    CassetteHttpx,
+    CassetteMissError,
+    CassetteTransport,
+)
+
+
+def _counting_handler(calls: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"call": len(calls), "path": request.url.path})
+
+    return httpx.MockTransport(handler)
+
+
+def test_sync_record_then_replay(tmp_path: Path) -> None:
+    path = tmp_path / "sync.json"
+    calls: list[httpx.Request] = []
+
+    cassette = Cassette(path)
+    assert cassette.recording
+    transport = CassetteTransport(cassette, wrapped=_counting_handler(calls))
+    with httpx.Client(transport=transport) as client:
+        response = client.get("https://site-a.atlassian.net/rest/api/3/issue/TEST-1")
+        assert response.json() == {"call": 1, "path": "/rest/api/3/issue/TEST-1"}
+    cassette.save()
+
+    assert path.exists()
+    assert len(calls) == 1
+
+    cassette = Cassette(path, "none")
+    assert not cassette.recording
+    transport = CassetteTransport(cassette, wrapped=_counting_handler(calls))
+    with httpx.Client(transport=transport) as client:
+        # Host and headers do not take part in matching
+        response = client.get(
+            "https://site-b.atlassian.net/rest/api/3/issue/TEST-1",
+            headers={"Authorization": "Basic other"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"call": 1, "path": "/rest/api/3/issue/TEST-1"}
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_repeated_requests_replay_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "async.json"
+    calls: list[httpx.Request] = []
+    url = "https://example.atlassian.net/rest/api/3/search"
+    params = {"jql": 'project = "TEST"', "maxResults": 10}
+
+    cassette = Cassette(path)
+    transport = AsyncCassetteTransport(cassette, wrapped=_counting_handler(calls))
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get(url, params=params)
+        await client.get(url, params=params)
+    cassette.save()
+
+    cassette = Cassette(path, "none")
+    async with httpx.AsyncClient(transport=AsyncCassetteTransport(cassette)) as client:
+        first = await client.get(url, params=dict(reversed(params.items())))
+        second = await client.get(url, params=params)
+        assert [first.json()["call"], second.json()["call"]] == [1, 2]
+
+        with pytest.raises(CassetteMissError):
+            await client.get(url, params=params)
+
+
+def test_json_body_matching_ignores_key_order(tmp_path: Path) -> None:
+    path = tmp_path / "body.json"
+    url = "https://example.atlassian.net/rest/api/3/issue"
+
+    cassette = Cassette(path)
+    transport = CassetteTransport(cassette, wrapped=_counting_handler([]))
+    with httpx.Client(transport=transport) as client:
+        client.post(url, json={"fields": {"summary": "A", "project": {"key": "TEST"}}})
+    cassette.save()
+
+    cassette = Cassette(path, "none")
+    with httpx.Client(transport=CassetteTransport(cassette)) as client:
+        response = client.post(url, json={"fields": {"project": {"key": "TEST"}, "summary": "A"}})
+        assert response.json()["call"] == 1
+
+        with pytest.raises(CassetteMissError):
+            client.post(url, json={"fields": {"project": {"key": "TEST"}, "summary": "B"}})
+
+
+def test_record_mode_all_overwrites_existing_cassette(tmp_path: Path) -> None:
+    path = tmp_path / "rerecord.json"
+    url = "https://example.atlassian.net/rest/api/3/myself"
+
+    for expected in ("old", "new"):
+        cassette = Cassette(path, "all")
+        wrapped = httpx.MockTransport(lambda request, body=expected: httpx.Response(200, text=body))
+        with httpx.Client(transport=CassetteTransport(cassette, wrapped=wrapped)) as client:
+            client.get(url)
+        cassette.save()
+
+    data = json.loads(path.read_text())
+    assert [entry["text"] for entries in data["interactions"].values() for entry in entries] == [
+        "new"
+    ]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_replay_only_without_cassette_raises(tmp_path: Path) -> None:
+    path = tmp_path / "missing.json"
+
+    cassette = Cassette(path, "none")
+    client = httpx.Client(transport=CassetteTransport(cassette))
+    with pytest.raises(CassetteMissError):
+        client.get("https://example.atlassian.net/rest/api/3/myself")
+    client.close()
+    cassette.save()
+
+    assert not path.exists()
+
+
+def test_invalid_record_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        Cassette(tmp_path / "bad.json", "sometimes")
+
+
+@pytest.mark.asyncio
+async def test_cassette_httpx_routes_clients_through_cassette(tmp_path: Path) -> None:
+    path = tmp_path / "patched.json"
+    url = "https://example.atlassian.net/rest/api/3/myself"
+
+    cassette = Cassette(path)
+    cassette.record(httpx.Request("GET", url), httpx.Response(200, json={"name": "replayed"}))
+    cassette.save()
+
+    patched_httpx = CassetteHttpx(Cassette(path, "none"))
+    assert patched_httpx.RequestError is httpx.RequestError
+
+    async with patched_httpx.AsyncClient() as client:
+        response = await client.get(url)
+        assert response.json() == {"name": "replayed"}
+
+    with patched_httpx.Client() as client, pytest.raises(CassetteMissError):
+        client.get(url)
+
+
+def test_recorded_bodies_are_scrubbed(tmp_path: Path) -> None:
+    path = tmp_path / "scrubbed.json"
+    url = "https://acme.atlassian.net/rest/api/3/issue/TEST-1"
+    body = {
+        "self": url,
+        "key": "TEST-1",
+        "fields": {
+            "assignee": {
+                "self": "https://acme.atlassian.net/rest/api/3/user?accountId=5b10ac8d82e05b22cc7d4ef5",
+                "accountId": "5b10ac8d82e05b22cc7d4ef5",
+                "emailAddress": "jane@acme.com",
+                "avatarUrls": {"48x48": "https://acme.atlassian.net/avatar.png"},
+            }
+        },
+    }
+
+    cassette = Cassette(path, replacements={"acme.atlassian.net": "example.atlassian.net"})
+    wrapped = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    with httpx.Client(transport=CassetteTransport(cassette, wrapped=wrapped)) as client:
+        # The caller still sees the real response while recording
+        assert client.get(url).json() == body
+    cassette.save()
+
+    saved = path.read_text()
+    assert "acme.atlassian.net" not in saved
+    assert "jane@acme.com" not in saved
+    assert "5b10ac8d82e05b22cc7d4ef5" not in saved
+
+    cassette = Cassette(path, "none")
+    with httpx.Client(transport=CassetteTransport(cassette)) as client:
+        assignee = client.get(url).json()["fields"]["assignee"]
+    assert assignee["emailAddress"] == "user@example.com"
+    assert assignee["accountId"] != "5b10ac8d82e05b22cc7d4ef5"
+    assert assignee["avatarUrls"]["48x48"] == "https://example.atlassian.net/avatar.png"
@@ -0,0 +1,384 @@
+import json
+import re
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+from arcade.sdk.errors import ToolExecutionError
+
+from arcade_jira.tools.issues import list_issue_changes
+from arcade_jira.tools.utils import (
+    ChangePosition,
+    _decode_change_cursor,
+    _encode_change_cursor,
+    _format_jql_datetime,
+    _parse_jira_datetime,
+)
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+def _ts(second: int, minute: int = 30, millis: int = 0) -> str:
+    return f"2024-01-15T10:{minute:02d}:{second:02d}.{millis:03d}+0100"
+
+
+class FakeJiraSearch:
+    """An in-memory Jira whose /search endpoint honours the JQL the changes feed sends."""
+
+    def __init__(
+        self, updated: dict[int, str], page_cap: int = 100, time_zone: str = "Europe/Paris"
+    ) -> None:
+        self.updated = updated
+        self.page_cap = page_cap
+        self.time_zone = time_zone
+        self.requests: list[httpx.Request] = []
+        self.search_requests: list[httpx.Request] = []
+        self.before_request: Callable[[int], None] | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/rest/api/3")
+        if path == "/myself":
+            return httpx.Response(200, json={"timeZone": self.time_zone})
+        if path.startswith("/issue/"):
+            issue_id = int(path.removeprefix("/issue/"))
+            if issue_id not in self.updated:
+                return httpx.Response(404, json={"errorMessages": ["Issue does not exist"]})
+            return httpx.Response(
+                200, json={"id": str(issue_id), "fields": {"updated": self.updated[issue_id]}}
+            )
+        return self._search(request)
+
+    def _search(self, request: httpx.Request) -> httpx.Response:
+        self.search_requests.append(request)
+        if self.before_request is not None:
+            self.before_request(len(self.search_requests))
+
+        params = request.url.params
+        items = sorted(self.updated.items(), key=lambda kv: (_parse_jira_datetime(kv[1]), kv[0]))
+        bound = re.search(r'updated >= "([^"]+)"', params["jql"])
+        if bound:
+            # JQL date literals are in the searching user's timezone
+            since = datetime.strptime(bound.group(1), "%Y/%m/%d %H:%M").replace(
+                tzinfo=ZoneInfo(self.time_zone)
+            )
+            items = [kv for kv in items if _parse_jira_datetime(kv[1]) >= since]
+
+        start_at = int(params["startAt"])
+        count = min(int(params["maxResults"]), self.page_cap)
+        issues = [
+            {"id": str(issue_id), "key": f"TEST-{issue_id}", "fields": {"updated": updated}}
+            for issue_id, updated in items[start_at : start_at + count]
+        ]
+        return httpx.Response(200, json={"issues": issues, "total": len(items)})
+
+
+class _MockHttpx:
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(httpx, name)
+
+    def AsyncClient(self, **kwargs: Any) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=self.transport, **kwargs)
+
+
+@pytest.fixture
+def jira_search(monkeypatch: pytest.MonkeyPatch) -> Callable[..., FakeJiraSearch]:
+    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "test@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "test-token")
+
+    def install(
+        updated: dict[int, str], page_cap: int = 100, time_zone: str = "Europe/Paris"
+    ) -> FakeJiraSearch:
+        search = FakeJiraSearch(updated, page_cap, time_zone)
+        monkeypatch.setattr(
+            "arcade_jira.tools.utils.httpx", _MockHttpx(httpx.MockTransport(search))
+        )
+        return search
+
+    return install
+
+
+def _ids(changes: dict[str, Any]) -> list[int]:
+    return [int(json.loads(issue)["id"]) for issue in changes["issues"]]
+
+
+def test_parse_jira_datetime() -> None:
+    parsed = _parse_jira_datetime("2024-01-15T10:30:45.123+0100")
+    assert parsed == datetime(2024, 1, 15, 9, 30, 45, 123000, tzinfo=timezone.utc)
+
+
+def test_format_jql_datetime_uses_user_time_zone() -> None:
+    value = "2024-01-15T10:30:45.123+0100"
+    assert _format_jql_datetime(value, ZoneInfo("Europe/Paris")) == "2024/01/15 10:30"
+    assert _format_jql_datetime(value, ZoneInfo("America/New_York")) == "2024/01/15 04:30"
+    assert _format_jql_datetime(value, ZoneInfo("Asia/Tokyo")) == "2024/01/15 18:30"
+
+
+def test_change_cursor_round_trip() -> None:
+    cursor = _encode_change_cursor("2024-01-15T10:30:45.123+0100", 10001)
+    assert re.fullmatch(r"[A-Za-z0-9_\-=]+", cursor)
+
+    position = _decode_change_cursor(cursor)
+    assert position == ChangePosition(
+        _parse_jira_datetime("2024-01-15T10:30:45.123+0100"),
+        10001,
+        "2024-01-15T10:30:45.123+0100",
+    )
+
+
+def test_change_position_breaks_ties_by_id() -> None:
+    earlier = ChangePosition(_parse_jira_datetime(_ts(0)), 7, _ts(0))
+    later_id = ChangePosition(_parse_jira_datetime(_ts(0)), 8, _ts(0))
+    later_time = ChangePosition(_parse_jira_datetime(_ts(0, millis=1)), 1, _ts(0, millis=1))
+
+    assert earlier.is_before(later_id)
+    assert later_id.is_before(later_time)
+    assert not later_id.is_before(earlier)
+    assert not earlier.is_before(earlier)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "bm90IGpzb24=",  # "not json"
+        _encode_change_cursor("yesterday", 1),
+        "eyJ1cGRhdGVkIjoiMjAyNC0wMS0xNVQxMDozMDo0NS4xMjMrMDEwMCJ9",  # no id
+    ],
+)
+def test_decode_change_cursor_rejects_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(ToolExecutionError):
+        _decode_change_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_rejects_invalid_cursor(jira_search: Callable) -> None:
+    search = jira_search({1: _ts(0)})
+
+    with pytest.raises(ToolExecutionError):
+        await list_issue_changes("TEST", cursor="not a cursor")
+
+    assert search.requests == []
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_from_start_then_empty_poll(jira_search: Callable) -> None:
+    search = jira_search({2: _ts(5), 1: _ts(9), 3: _ts(1)})
+
+    changes = await list_issue_changes("TEST")
+    assert _ids(changes) == [3, 2, 1]
+    assert changes["has_more"] is False
+
+    assert [request.url.path for request in search.requests] == [
+        "/rest/api/3/myself",
+        "/rest/api/3/search",
+    ]
+    params = search.search_requests[0].url.params
+    assert params["jql"] == 'project = "TEST" ORDER BY updated ASC, id ASC'
+    assert params["fields"] == "summary,status,updated"
+
+    again = await list_issue_changes("TEST", cursor=changes["next_cursor"])
+    assert again["issues"] == []
+    assert again["has_more"] is False
+    assert again["next_cursor"] == changes["next_cursor"]
+    assert 'updated >= "2024/01/15 10:30"' in search.search_requests[-1].url.params["jql"]
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_same_minute_uses_timestamp_and_id(
+    jira_search: Callable,
+) -> None:
+    jira_search({
+        1: _ts(59, minute=29),
+        3: _ts(0),
+        5: _ts(0),
+        7: _ts(0),
+        2: _ts(0, millis=1),
+    })
+    cursor = _encode_change_cursor(_ts(0), 5)
+
+    changes = await list_issue_changes("TEST", cursor=cursor)
+
+    assert _ids(changes) == [7, 2]
+    assert _decode_change_cursor(changes["next_cursor"]).issue_id == 2
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_limit_hit_mid_page(jira_search: Callable) -> None:
+    jira_search({issue_id: _ts(issue_id) for issue_id in range(1, 6)})
+
+    changes = await list_issue_changes("TEST", max_results=2)
+    assert _ids(changes) == [1, 2]
+    assert changes["has_more"] is True
+
+    rest = await list_issue_changes("TEST", cursor=changes["next_cursor"], max_results=10)
+    assert _ids(rest) == [3, 4, 5]
+    assert rest["has_more"] is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("issue_count", "has_more"), [(2, False), (3, True)])
+async def test_list_issue_changes_limit_hit_at_page_boundary(
+    jira_search: Callable, issue_count: int, has_more: bool
+) -> None:
+    jira_search({issue_id: _ts(issue_id) for issue_id in range(issue_count)}, page_cap=2)
+
+    changes = await list_issue_changes("TEST", max_results=2)
+
+    assert _ids(changes) == [0, 1]
+    assert changes["has_more"] is has_more
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_pages_past_seen_issues(jira_search: Callable) -> None:
+    updated = {issue_id: _ts(0) for issue_id in range(1, 8)}
+    updated[9] = _ts(1)
+    search = jira_search(updated, page_cap=2)
+    cursor = _encode_change_cursor(_ts(0), 7)
+
+    changes = await list_issue_changes("TEST", cursor=cursor, max_results=5)
+
+    assert _ids(changes) == [9]
+    assert changes["has_more"] is False
+    assert len(search.search_requests) > 1
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_survives_edits_between_pages(jira_search: Callable) -> None:
+    updated = {issue_id: _ts(issue_id) for issue_id in range(6)}
+    search = jira_search(updated, page_cap=2)
+
+    def edit_first_issue(request_number: int) -> None:
+        if request_number == 2:
+            updated[0] = _ts(0, minute=31)
+
+    search.before_request = edit_first_issue
+
+    changes = await list_issue_changes("TEST")
+
+    # Nothing is skipped, and the edited issue is returned once with its latest state
+    assert _ids(changes) == [1, 2, 3, 4, 5, 0]
+    assert json.loads(changes["issues"][-1])["fields"]["updated"] == _ts(0, minute=31)
+
+    again = await list_issue_changes("TEST", cursor=changes["next_cursor"])
+    assert again["issues"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_survives_deletions_between_pages(
+    jira_search: Callable,
+) -> None:
+    updated = {issue_id: _ts(issue_id) for issue_id in range(8)}
+    search = jira_search(updated, page_cap=3)
+
+    def delete_seen_issues(request_number: int) -> None:
+        if request_number == 3:
+            del updated[0]
+            del updated[1]
+
+    search.before_request = delete_seen_issues
+
+    changes = await list_issue_changes("TEST")
+
+    assert _ids(changes) == [0, 1, 2, 3, 4, 5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_bound_in_user_time_zone(jira_search: Callable) -> None:
+    search = jira_search({1: _ts(0), 2: _ts(5)}, time_zone="America/New_York")
+    cursor = _encode_change_cursor(_ts(0), 1)
+
+    changes = await list_issue_changes("TEST", cursor=cursor)
+
+    assert _ids(changes) == [2]
+    assert 'updated >= "2024/01/15 04:30"' in search.search_requests[0].url.params["jql"]
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_empty_poll_is_cheap(jira_search: Callable) -> None:
+    # A day of changes, one a minute, already read up to the end
+    start = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    updated = {
+        issue_id: (start - timedelta(minutes=issue_id)).strftime("%Y-%m-%dT%H:%M:%S.000%z")
+        for issue_id in range(1000)
+    }
+    search = jira_search(updated)
+    cursor = _encode_change_cursor(updated[0], 0)
+
+    changes = await list_issue_changes("TEST", cursor=cursor, max_results=1)
+
+    assert changes["issues"] == []
+    assert len(search.search_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_pages_do_not_follow_max_results(jira_search: Callable) -> None:
+    updated = {issue_id: _ts(0) for issue_id in range(250)}
+    updated[250] = _ts(1)
+    search = jira_search(updated)
+    cursor = _encode_change_cursor(_ts(0), 249)
+
+    changes = await list_issue_changes("TEST", cursor=cursor, max_results=1)
+
+    assert _ids(changes) == [250]
+    assert {request.url.params["maxResults"] for request in search.search_requests} == {"100"}
+    assert len(search.search_requests) == 3
+
+
+def _spread_out(issue_count: int) -> dict[int, str]:
+    return {
+        issue_id: _ts(issue_id % 60, minute=issue_id // 60, millis=issue_id % 7)
+        for issue_id in range(issue_count)
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_requeries_when_anchor_is_edited(
+    jira_search: Callable,
+) -> None:
+    unedited = jira_search(_spread_out(300), page_cap=10)
+    await list_issue_changes("TEST", max_results=500)
+    baseline = len(unedited.requests)
+
+    updated = _spread_out(300)
+    search = jira_search(updated, page_cap=10)
+
+    def edit_anchor(request_number: int) -> None:
+        if request_number == 20:
+            # The last issue of page 19, which page 20 is expected to start with
+            anchor_id = int(search.search_requests[-2].url.params["startAt"]) + 9
+            updated[anchor_id] = _ts(0, minute=59)
+
+    search.before_request = edit_anchor
+
+    changes = await list_issue_changes("TEST", max_results=500)
+
+    assert sorted(_ids(changes)) == list(range(300))
+    assert _ids(changes)[-1] == 171
+    # One lookup of the anchor, then at most a rescan of the last kept issue's minute
+    # (60 issues in pages overlapping by one), not a step back through every page
+    assert len(search.requests) <= baseline + 1 + 8
+
+
+@pytest.mark.asyncio
+async def test_list_issue_changes_edited_anchor_in_next_page(jira_search: Callable) -> None:
+    updated = {issue_id: _ts(issue_id * 2) for issue_id in range(5)}
+    search = jira_search(updated, page_cap=3)
+
+    def edit_anchor(request_number: int) -> None:
+        if request_number == 2:
+            # Moves the anchor (issue 2) between issues 3 and 4, still in the next page
+            updated[2] = _ts(7)
+
+    search.before_request = edit_anchor
+
+    changes = await list_issue_changes("TEST")
+
+    assert _ids(changes) == [0, 1, 3, 2, 4]
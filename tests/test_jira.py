@@ -6,11 +6,14 @@ from arcade_jira.tools.issues import (
     create_issue,
     delete_issue,
     get_issue_transitions,
+    list_issue_changes,
     list_project_issues,
     transition_issue,
 )
+from arcade_jira.tools.utils import ChangePosition, _decode_change_cursor
 
 pytest_plugins = ("pytest_asyncio",)
+pytestmark = pytest.mark.usefixtures("jira_cassette")
 
 
 @pytest.mark.asyncio
@@ -79,6 +82,53 @@ async def test_list_project_issues() -> None:
         pytest.fail(f"Test failed: {e!s}")
 
 
+@pytest.mark.asyncio
+async def test_list_issue_changes() -> None:
+    project_key = "TEST"
+
+    try:
+        # Read the feed up to its current end
+        cursor = None
+        while True:
+            changes = await list_issue_changes(project_key, cursor=cursor, max_results=50)
+            cursor = changes["next_cursor"]
+            if not changes["has_more"]:
+                break
+
+        # Create a test issue
+        issue_key = await create_issue(
+            project_key=project_key,
+            summary="Test Issue for Listing Changes",
+            description="This is a test issue for testing the changes feed",
+            issue_type="Task",
+        )
+
+        # The new issue should be reported after the last cursor. Other tests may be
+        # changing issues in the same project concurrently, so more may come back.
+        since = _decode_change_cursor(cursor) if cursor else None
+        created_issue = None
+        while True:
+            changes = await list_issue_changes(project_key, cursor=cursor)
+            for issue in [json.loads(i) for i in changes["issues"]]:
+                fields = issue["fields"]
+                assert "summary" in fields
+                assert "status" in fields
+                assert "updated" in fields
+                if issue["key"] == issue_key:
+                    created_issue = issue
+            cursor = changes["next_cursor"]
+            if created_issue is not None or not changes["has_more"]:
+                break
+        assert created_issue is not None
+        if since is not None:
+            assert since.is_before(ChangePosition.from_issue(created_issue))
+
+        # Clean up
+        await delete_issue(issue_key)
+    except Exception as e:
+        pytest.fail(f"Test failed: {e!s}")
+
+
 @pytest.mark.asyncio
 async def test_transition_issue() -> None:
     project_key = "TEST"